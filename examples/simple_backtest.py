@@ -9,6 +9,269 @@ When the fast SMA crosses below the slow SMA, we sell (bearish signal).
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from numba import njit, prange, types
+
+try:
+    import bottleneck as bn
+except ImportError:  # optional, falls back to a cumulative-sum SMA
+    bn = None
+
+
+# Trade type codes used by the compiled event loop
+BUY = 0
+SELL = 1
+
+# Close prices may be read-only views (pandas copy-on-write), so the
+# kernels accept them without forcing a copy
+_closes_t = types.Array(types.float64, 1, 'A', readonly=True)
+_closes32_t = types.Array(types.float32, 1, 'A', readonly=True)
+_close_matrix32_t = types.Array(types.float32, 2, 'A', readonly=True)
+
+
+# Explicit signatures compile the kernels at import time; cache=True then
+# reuses the compiled code from __pycache__ on later runs
+@njit('UniTuple(f8, 2)(f8, f8, f8, f8, f8)', cache=True)
+def _order(direction, price, capital, position, commission):
+    """
+    Size a crossover order: buy with 50% of capital (+1) or sell all shares (-1).
+    
+    Returns:
+        (shares, cash) where cash is the signed cash flow including fees
+        (> 0 spent on buys, < 0 received on sells). shares is 0 when the
+        order cannot be filled, including bars with a missing (NaN) price.
+    """
+    if not price > 0:
+        return 0.0, 0.0
+    
+    shares = (capital * 0.5) // price if direction > 0 else position
+    # Fee folded in: gross * direction + gross * commission in one multiply
+    cash = shares * price * (direction + commission)
+    if shares > 0 and cash <= capital:
+        return shares, cash
+    return 0.0, 0.0
+
+
+@njit((_closes_t, types.int64[:], types.int8[:], types.float64, types.float64,
+       types.float64[:]), cache=True)
+def _run(closes, crossover_idx, crossover_sign, init_capital, commission, equity):
+    """
+    Compiled event loop for the SMA crossover backtest.
+    
+    Buys with 50% of capital on bullish crossovers and sells the whole
+    position on bearish ones, marking the portfolio to market every bar
+    into the preallocated equity array.
+    
+    Returns:
+        (capital, position, n_trades, trade_bars, trade_types,
+         trade_prices, trade_shares, trade_costs, trade_proceeds)
+    
+    The trade log is preallocated for one trade per crossover event and
+    filled up to n_trades. For sells, trade_costs holds the cost basis of
+    the shares sold.
+    """
+    n = closes.shape[0]
+    n_events = crossover_idx.shape[0]
+    
+    trade_bars = np.empty(n_events, dtype=np.int64)
+    trade_types = np.empty(n_events, dtype=np.int8)
+    trade_prices = np.empty(n_events)
+    trade_shares = np.empty(n_events)
+    trade_costs = np.empty(n_events)
+    trade_proceeds = np.empty(n_events)
+    
+    capital = init_capital
+    position = 0.0
+    cost_basis = 0.0
+    last_price = 0.0  # last valid close, for marking through NaN gaps
+    n_trades = 0
+    k = 0
+    
+    for i in range(n):
+        price = closes[i]
+        
+        if k < n_events and crossover_idx[k] == i:
+            direction = 1.0 if crossover_sign[k] > 0 else -1.0
+            shares, cash = _order(direction, price, capital, position, commission)
+            
+            if shares > 0:
+                capital -= cash
+                position += direction * shares
+                trade_bars[n_trades] = i
+                trade_prices[n_trades] = price
+                trade_shares[n_trades] = shares
+                if direction > 0:
+                    cost_basis += cash
+                    trade_types[n_trades] = BUY
+                    trade_costs[n_trades] = cash
+                    trade_proceeds[n_trades] = 0.0
+                else:
+                    trade_types[n_trades] = SELL
+                    trade_costs[n_trades] = cost_basis
+                    trade_proceeds[n_trades] = -cash
+                    cost_basis = 0.0
+                n_trades += 1
+            
+            k += 1
+        
+        # Track equity curve, holding the last valid price over missing bars
+        if not np.isnan(price):
+            last_price = price
+        equity[i] = capital + position * last_price
+    
+    return (capital, position, n_trades, trade_bars, trade_types,
+            trade_prices, trade_shares, trade_costs, trade_proceeds)
+
+
+@njit('f8(f8[:])', cache=True)
+def _max_drawdown(equity):
+    """Largest peak-to-trough decline of an equity curve, in a single pass"""
+    peak = equity[0]
+    worst = 0.0
+    for value in equity:
+        if value > peak:
+            peak = value
+        drawdown = (value - peak) / peak
+        if drawdown < worst:
+            worst = drawdown
+    return worst
+
+
+@njit((_closes32_t, types.int64, types.int64, types.float64, types.float64,
+       types.float32[:]), cache=True)
+def sma_crossover_backtest(close, fast_p, slow_p, init_capital, commission, equity_out):
+    """
+    Fused single-pass SMA crossover backtest.
+    
+    Walks the close array once, keeping rolling sums for both SMAs,
+    detecting crossovers and executing trades inline, and writes the
+    portfolio value of every bar into equity_out. Trades follow the same
+    rules as _run but are not logged. Like calculate_sma, an SMA is
+    undefined while its window contains a NaN close.
+    
+    close and equity_out are float32 to halve memory traffic on large
+    sweeps; the running sums, cash and drawdown stay in float64.
+    
+    Returns:
+        (final_value, max_drawdown, n_trades)
+    """
+    n = close.shape[0]
+    warmup = max(fast_p, slow_p) - 1
+    
+    fast_sum = 0.0
+    slow_sum = 0.0
+    fast_nans = 0  # NaN closes currently inside each window
+    slow_nans = 0
+    prev_sign = 0
+    capital = init_capital
+    position = 0.0
+    last_price = 0.0  # last valid close, for marking through NaN gaps
+    n_trades = 0
+    peak = init_capital
+    max_drawdown = 0.0
+    
+    for i in range(n):
+        price = close[i]
+        
+        # Rolling sums for both SMAs, counting NaNs instead of summing them
+        if np.isnan(price):
+            fast_nans += 1
+            slow_nans += 1
+        else:
+            fast_sum += price
+            slow_sum += price
+        if i >= fast_p:
+            old = close[i - fast_p]
+            if np.isnan(old):
+                fast_nans -= 1
+            else:
+                fast_sum -= old
+        if i >= slow_p:
+            old = close[i - slow_p]
+            if np.isnan(old):
+                slow_nans -= 1
+            else:
+                slow_sum -= old
+        
+        # Sign of the SMA spread (0 while either SMA is warming up or undefined)
+        sign = 0
+        if i >= warmup and fast_nans == 0 and slow_nans == 0:
+            spread = fast_sum / fast_p - slow_sum / slow_p
+            sign = 1 if spread > 0 else (-1 if spread < 0 else 0)
+        cross = sign - prev_sign if i > 0 else 0
+        prev_sign = sign
+        
+        if cross != 0:
+            direction = 1.0 if cross > 0 else -1.0
+            shares, cash = _order(direction, price, capital, position, commission)
+            if shares > 0:
+                capital -= cash
+                position += direction * shares
+                n_trades += 1
+        
+        # Track equity curve and drawdown, holding the last valid price
+        # over missing bars
+        if not np.isnan(price):
+            last_price = price
+        value = capital + position * last_price
+        equity_out[i] = value
+        if value > peak:
+            peak = value
+        drawdown = (value - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+    
+    return capital + position * last_price, max_drawdown, n_trades
+
+
+@njit((_closes32_t, types.int64[:], types.int64[:], types.float64, types.float64,
+       types.float32[:, :]), parallel=True, cache=True)
+def _run_grid(closes, fast_periods, slow_periods, init_capital, commission, equity_out):
+    """
+    Run the fused backtest for every (fast, slow) period pair in parallel.
+    
+    Each pair is an independent parameter combination, so pairs are
+    spread across cores with prange and written into equity_out[:, j].
+    
+    Returns:
+        (final_value, max_drawdown, n_trades) arrays with one entry per pair
+    """
+    n_params = fast_periods.shape[0]
+    final_value = np.empty(n_params)
+    max_drawdown = np.empty(n_params)
+    n_trades = np.empty(n_params, dtype=np.int64)
+    
+    for j in prange(n_params):
+        final_value[j], max_drawdown[j], n_trades[j] = sma_crossover_backtest(
+            closes, fast_periods[j], slow_periods[j], init_capital, commission,
+            equity_out[:, j]
+        )
+    
+    return final_value, max_drawdown, n_trades
+
+
+@njit((_close_matrix32_t, types.int64, types.int64, types.float64, types.float64,
+       types.float32[:, :]), parallel=True, cache=True)
+def _run_portfolio(closes, fast_p, slow_p, init_capital, commission, equity_out):
+    """
+    Run the fused backtest for every symbol (column of closes) in parallel.
+    
+    Symbols are independent, so they are spread across cores with prange
+    and written into equity_out[:, s].
+    
+    Returns:
+        (final_value, max_drawdown, n_trades) arrays with one entry per symbol
+    """
+    n_symbols = closes.shape[1]
+    final_value = np.empty(n_symbols)
+    max_drawdown = np.empty(n_symbols)
+    n_trades = np.empty(n_symbols, dtype=np.int64)
+    
+    for s in prange(n_symbols):
+        final_value[s], max_drawdown[s], n_trades[s] = sma_crossover_backtest(
+            closes[:, s], fast_p, slow_p, init_capital, commission, equity_out[:, s]
+        )
+    
+    return final_value, max_drawdown, n_trades
 
 
 class SimpleBacktester:
@@ -27,43 +290,72 @@ class SimpleBacktester:
         self.commission = commission
         self.reset()
     
-    def reset(self):
-        """Reset backtest state"""
+    def reset(self, n=0):
+        """Reset backtest state for a run of n bars"""
         self.capital = self.initial_capital
         self.position = 0  # shares held
-        self.trades = []
-        self.equity_curve = []
+        self.equity_curve = np.empty(n, dtype=np.float64)
+        
+        # Trade log as parallel arrays (struct-of-arrays), one entry per trade
+        self.trade_bars = np.empty(0, dtype=np.int64)
+        self.trade_types = np.empty(0, dtype=np.int8)  # BUY / SELL
+        self.trade_prices = np.empty(0, dtype=np.float64)
+        self.trade_shares = np.empty(0, dtype=np.float64)
+        self.trade_costs = np.empty(0, dtype=np.float64)  # cost basis for sells
+        self.trade_proceeds = np.empty(0, dtype=np.float64)  # 0 for buys
     
-    def execute_trade(self, price, shares, timestamp):
-        """Execute a buy or sell trade"""
-        cost = abs(shares * price)
-        commission_cost = cost * self.commission
+    def run(self, closes, crossover):
+        """
+        Simulate the strategy over a price series.
+        
+        Args:
+            closes: Array of close prices
+            crossover: Array of crossover signals (>0 buy, <0 sell, 0 or NaN hold)
+        """
+        self.reset(len(closes))
+        
+        # The compiled loop takes int8 signals
+        crossover = np.asarray(crossover)
+        if crossover.dtype != np.int8:
+            crossover = np.sign(np.nan_to_num(crossover)).astype(np.int8)
+        crossover_idx = np.flatnonzero(crossover)
+        
+        (self.capital, self.position, n_trades, trade_bars,
+         trade_types, trade_prices, trade_shares, trade_costs,
+         trade_proceeds) = _run(
+            np.ascontiguousarray(closes, dtype=np.float64),
+            crossover_idx,
+            crossover[crossover_idx],
+            float(self.initial_capital),
+            float(self.commission),
+            self.equity_curve,
+        )
+        
+        # The kernel sizes the log for one trade per crossover; keep the filled part
+        self.trade_bars = trade_bars[:n_trades]
+        self.trade_types = trade_types[:n_trades]
+        self.trade_prices = trade_prices[:n_trades]
+        self.trade_shares = trade_shares[:n_trades]
+        self.trade_costs = trade_costs[:n_trades]
+        self.trade_proceeds = trade_proceeds[:n_trades]
         
-        if shares > 0:  # Buy
-            total_cost = cost + commission_cost
-            if total_cost <= self.capital:
-                self.capital -= total_cost
-                self.position += shares
-                self.trades.append({
-                    'timestamp': timestamp,
-                    'type': 'BUY',
-                    'price': price,
-                    'shares': shares,
-                    'cost': total_cost
-                })
-        else:  # Sell
-            shares_to_sell = abs(shares)
-            if shares_to_sell <= self.position:
-                proceeds = cost - commission_cost
-                self.capital += proceeds
-                self.position -= shares_to_sell
-                self.trades.append({
-                    'timestamp': timestamp,
-                    'type': 'SELL',
-                    'price': price,
-                    'shares': shares_to_sell,
-                    'proceeds': proceeds
-                })
+        return self.equity_curve
+    
+    def get_trades(self, timestamps):
+        """
+        Build a DataFrame view of the trade log.
+        
+        Args:
+            timestamps: Bar timestamps of the simulated series
+        """
+        return pd.DataFrame({
+            'timestamp': np.asarray(timestamps)[self.trade_bars],
+            'type': np.where(self.trade_types == BUY, 'BUY', 'SELL'),
+            'price': self.trade_prices,
+            'shares': self.trade_shares,
+            'cost': self.trade_costs,
+            'proceeds': self.trade_proceeds
+        })
     
     def get_portfolio_value(self, current_price):
         """Calculate total portfolio value"""
@@ -71,8 +363,51 @@ class SimpleBacktester:
 
 
 def calculate_sma(prices, period):
-    """Calculate Simple Moving Average"""
-    return prices.rolling(window=period).mean()
+    """
+    Calculate Simple Moving Average
+    
+    Returns a float64 array with NaN for the first period - 1 bars. Uses
+    bottleneck's C rolling mean when installed, otherwise a single
+    cumulative-sum pass.
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+    if bn is not None:
+        return bn.move_mean(prices, window=period, min_count=period)
+    
+    # Cumulative sums of the prices and of the NaN mask, so a missing price
+    # only blanks the windows that contain it
+    missing = np.isnan(prices)
+    cs = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, prices))))
+    cn = np.concatenate(([0], np.cumsum(missing)))
+    
+    sma = np.full(len(prices), np.nan)
+    sma[period - 1:] = (cs[period:] - cs[:-period]) / period
+    sma[period - 1:][cn[period:] - cn[:-period] > 0] = np.nan
+    return sma
+
+
+def calculate_crossovers(close, fast_period, slow_period):
+    """
+    Calculate SMA crossover events in a single NumPy pass
+    
+    Returns an int8 array that is positive where the fast SMA crosses
+    above the slow SMA, negative where it crosses below, and 0 elsewhere.
+    """
+    spread = calculate_sma(close, fast_period) - calculate_sma(close, slow_period)
+    
+    # Sign of the SMA spread (0 while either SMA is still warming up)
+    sign = np.sign(spread)
+    sign[np.isnan(spread)] = 0
+    sign = sign.astype(np.int8)
+    
+    # Signal changes between consecutive bars
+    crossover = np.empty_like(sign)
+    crossover[0] = 0
+    np.subtract(sign[1:], sign[:-1], out=crossover[1:])
+    
+    return crossover
 
 
 def run_sma_crossover_backtest(data, fast_period=20, slow_period=50):
@@ -87,56 +422,28 @@ def run_sma_crossover_backtest(data, fast_period=20, slow_period=50):
     Returns:
         Dictionary with backtest results
     """
-    # Calculate SMAs
-    data['sma_fast'] = calculate_sma(data['close'], fast_period)
-    data['sma_slow'] = calculate_sma(data['close'], slow_period)
+    closes = data['close'].to_numpy()
     
     # Generate signals
-    data['signal'] = 0
-    data.loc[data['sma_fast'] > data['sma_slow'], 'signal'] = 1  # Bullish
-    data.loc[data['sma_fast'] < data['sma_slow'], 'signal'] = -1  # Bearish
-    
-    # Detect crossovers (signal changes)
-    data['position'] = data['signal'].diff()
+    crossover = calculate_crossovers(closes, fast_period, slow_period)
     
-    # Initialize backtester
+    # Run the compiled event loop
     backtester = SimpleBacktester(initial_capital=10000, commission=0.001)
+    equity = backtester.run(closes, crossover)
     
-    # Execute trades on crossovers
-    for idx, row in data.iterrows():
-        if pd.notna(row['position']) and row['position'] != 0:
-            if row['position'] > 0:  # Buy signal
-                # Buy with 50% of capital
-                shares_to_buy = (backtester.capital * 0.5) // row['close']
-                if shares_to_buy > 0:
-                    backtester.execute_trade(row['close'], shares_to_buy, idx)
-            
-            elif row['position'] < 0:  # Sell signal
-                # Sell all shares
-                if backtester.position > 0:
-                    backtester.execute_trade(row['close'], -backtester.position, idx)
-        
-        # Track equity curve
-        portfolio_value = backtester.get_portfolio_value(row['close'])
-        backtester.equity_curve.append({
-            'timestamp': idx,
-            'value': portfolio_value
-        })
-    
-    # Calculate performance metrics
-    equity_curve_df = pd.DataFrame(backtester.equity_curve)
-    final_value = equity_curve_df['value'].iloc[-1]
+    # Calculate performance metrics on the raw arrays
+    final_value = float(equity[-1])
     total_return = (final_value - backtester.initial_capital) / backtester.initial_capital
     
     # Calculate max drawdown
-    running_max = equity_curve_df['value'].expanding().max()
-    drawdown = (equity_curve_df['value'] - running_max) / running_max
-    max_drawdown = drawdown.min()
+    max_drawdown = _max_drawdown(equity)
     
     # Win rate
-    winning_trades = sum(1 for t in backtester.trades if t['type'] == 'SELL' and 
-                        t.get('proceeds', 0) > t.get('cost', float('inf')))
-    total_trades = len([t for t in backtester.trades if t['type'] == 'SELL'])
+    sell_mask = backtester.trade_types == SELL
+    winning_trades = np.count_nonzero(
+        backtester.trade_proceeds[sell_mask] > backtester.trade_costs[sell_mask]
+    )
+    total_trades = np.count_nonzero(sell_mask)
     win_rate = winning_trades / total_trades if total_trades > 0 else 0
     
     return {
@@ -144,10 +451,100 @@ def run_sma_crossover_backtest(data, fast_period=20, slow_period=50):
         'final_value': final_value,
         'total_return': total_return,
         'max_drawdown': max_drawdown,
-        'total_trades': len(backtester.trades),
+        'total_trades': len(backtester.trade_types),
         'win_rate': win_rate,
-        'equity_curve': equity_curve_df,
-        'trades': backtester.trades
+        'equity_curve': pd.DataFrame({'value': equity}, index=data.index, copy=False),
+        'trades': backtester.get_trades(data.index)
+    }
+
+
+def run_sma_crossover_grid(data, fast_periods, slow_periods):
+    """
+    Run the SMA crossover backtest for every (fast, slow) period combination
+    
+    Each combination runs through the fused single-pass kernel, with the
+    combinations spread across cores, instead of calling
+    run_sma_crossover_backtest in a Python loop.
+    
+    Args:
+        data: DataFrame with 'close' prices
+        fast_periods: Iterable of fast SMA periods
+        slow_periods: Iterable of slow SMA periods
+    
+    Returns:
+        Dictionary with a per-combination results table and equity curves
+    """
+    initial_capital = 10000
+    commission = 0.001
+    
+    closes = data['close'].to_numpy(dtype=np.float32)
+    params = pd.MultiIndex.from_product(
+        [list(fast_periods), list(slow_periods)],
+        names=['fast_period', 'slow_period']
+    )
+    fast = np.array(params.get_level_values('fast_period'), dtype=np.int64)
+    slow = np.array(params.get_level_values('slow_period'), dtype=np.int64)
+    
+    # Column-major so each combination's equity curve is contiguous; float32
+    # halves the memory of large sweeps
+    equity = np.empty((len(closes), len(params)), dtype=np.float32, order='F')
+    final_value, max_drawdown, n_trades = _run_grid(
+        closes, fast, slow, float(initial_capital), commission, equity
+    )
+    
+    results = pd.DataFrame({
+        'final_value': final_value,
+        'total_return': (final_value - initial_capital) / initial_capital,
+        'max_drawdown': max_drawdown,
+        'total_trades': n_trades,
+    }, index=params)
+    
+    return {
+        'initial_capital': initial_capital,
+        'results': results,
+        'equity_curves': pd.DataFrame(equity, index=data.index, columns=params)
+    }
+
+
+def run_portfolio(close_matrix, fast_period=20, slow_period=50):
+    """
+    Run the SMA crossover backtest on every symbol of a universe
+    
+    Each symbol is simulated independently with its own starting capital,
+    with symbols spread across cores in one compiled pass. NaN closes
+    (e.g. before a listing or after a delisting) never trade, and
+    positions are marked at the last valid close over them.
+    
+    Args:
+        close_matrix: DataFrame of close prices with one column per symbol
+        fast_period: Fast SMA period
+        slow_period: Slow SMA period
+    
+    Returns:
+        Dictionary with a per-symbol results table and equity curves
+    """
+    initial_capital = 10000
+    commission = 0.001
+    
+    # Column-major so each symbol's prices and equity curve are contiguous
+    closes = np.asfortranarray(close_matrix.to_numpy(dtype=np.float32))
+    equity = np.empty(closes.shape, dtype=np.float32, order='F')
+    final_value, max_drawdown, n_trades = _run_portfolio(
+        closes, fast_period, slow_period, float(initial_capital), commission, equity
+    )
+    
+    results = pd.DataFrame({
+        'final_value': final_value,
+        'total_return': (final_value - initial_capital) / initial_capital,
+        'max_drawdown': max_drawdown,
+        'total_trades': n_trades,
+    }, index=close_matrix.columns)
+    
+    return {
+        'initial_capital': initial_capital,
+        'results': results,
+        'equity_curves': pd.DataFrame(equity, index=close_matrix.index,
+                                      columns=close_matrix.columns)
     }
 
 
@@ -156,24 +553,32 @@ def generate_sample_data(days=365):
     Generate sample OHLCV data for demonstration.
     In production, use real market data.
     """
-    dates = pd.date_range(start='2023-01-01', periods=days, freq='D')
+    dates = pd.date_range(start='2023-01-01', periods=days, freq='D', name='timestamp')
     
-    # Generate random walk price data
-    np.random.seed(42)
-    returns = np.random.normal(0.0005, 0.02, days)
-    prices = 100 * np.exp(np.cumsum(returns))
+    # Generate random walk price data in one buffer: returns -> log prices -> prices
+    rng = np.random.default_rng(42)
+    prices = np.empty(days, dtype=np.float64)
+    rng.standard_normal(days, out=prices)
+    prices *= 0.02
+    prices += 0.0005
+    np.cumsum(prices, out=prices)
+    np.exp(prices, out=prices)
+    prices *= 100
     
-    df = pd.DataFrame({
-        'timestamp': dates,
-        'open': prices * 0.995,
-        'high': prices * 1.015,
-        'low': prices * 0.985,
-        'close': prices,
-        'volume': np.random.randint(1000000, 5000000, days)
-    })
-    df.set_index('timestamp', inplace=True)
+    # Fill all OHLCV columns into a single buffer
+    arr = np.empty((days, 5), dtype=np.float64)
+    arr[:, 3] = prices
+    np.multiply(prices, 0.995, out=arr[:, 0])
+    np.multiply(prices, 1.015, out=arr[:, 1])
+    np.multiply(prices, 0.985, out=arr[:, 2])
+    arr[:, 4] = rng.integers(1_000_000, 5_000_000, days)
     
-    return df
+    return pd.DataFrame(
+        arr,
+        columns=['open', 'high', 'low', 'close', 'volume'],
+        index=dates,
+        copy=False
+    )
 
 
 if __name__ == "__main__":
@@ -186,8 +591,9 @@ if __name__ == "__main__":
     print("📊 Generating sample market data...")
     data = generate_sample_data(days=365)
     print(f"   Data period: {data.index[0].date()} to {data.index[-1].date()}")
-    print(f"   Starting price: ${data['close'].iloc[0]:.2f}")
-    print(f"   Ending price: ${data['close'].iloc[-1]:.2f}")
+    closes = data['close'].to_numpy()
+    print(f"   Starting price: ${closes[0]:.2f}")
+    print(f"   Ending price: ${closes[-1]:.2f}")
     print()
     
     # Run backtest
@@ -218,6 +624,22 @@ if __name__ == "__main__":
     else:
         print("🛑 Negative returns - needs optimization")
     
+    # Parameter sweep
+    print()
+    print("🔍 Parameter sweep (best 5 by total return):")
+    print("-" * 60)
+    grid = run_sma_crossover_grid(
+        data,
+        fast_periods=range(5, 35, 5),
+        slow_periods=range(40, 110, 10)
+    )
+    best = grid['results'].nlargest(5, 'total_return')
+    for (fast, slow), total_return, max_drawdown in zip(
+        best.index, best['total_return'].to_numpy(), best['max_drawdown'].to_numpy()
+    ):
+        print(f"   SMA {fast:>3}/{slow:<3}  Return: {total_return:>7.2%}  "
+              f"Max DD: {max_drawdown:>7.2%}")
+    
     print()
     print("=" * 60)
     print()
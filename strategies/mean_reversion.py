@@ -3,7 +3,7 @@ Mean Reversion Strategy
 Uses RSI to identify oversold/overbought conditions for mean reversion trades.
 """
 
-import numpy as np
+import math
 from typing import Dict
 from strategies.base_strategy import BaseStrategy
 
@@ -32,9 +32,14 @@ class MeanReversionStrategy(BaseStrategy):
         self.rsi_period = rsi_period
         self.rsi_oversold = rsi_oversold
         self.rsi_overbought = rsi_overbought
-        self.price_history = []
         self.entry_price = None
         
+        # Wilder RSI state
+        self._prev_close = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._n_deltas = 0
+        
     def on_data(self, data: Dict):
         """
         Process new market data and generate signals.
@@ -43,10 +48,15 @@ class MeanReversionStrategy(BaseStrategy):
             data: Dict with 'close', 'high', 'low', 'volume' keys
         """
         close_price = data['close']
-        self.price_history.append(close_price)
+        
+        # Skip bars with a missing close; RSI resumes from the last valid one
+        if math.isnan(close_price):
+            return
+        
+        self._update_rsi(close_price)
         
         # Need enough history for RSI calculation
-        if len(self.price_history) < self.rsi_period + 1:
+        if self._n_deltas < self.rsi_period:
             return
         
         # Calculate RSI
@@ -74,26 +84,48 @@ class MeanReversionStrategy(BaseStrategy):
                 self._record_trade(close_price)
                 self.entry_price = None
     
-    def _calculate_rsi(self) -> float:
+    def _update_rsi(self, close_price: float):
         """
-        Calculate Relative Strength Index.
+        Update Wilder's smoothed average gain/loss with a new close.
         
-        RSI = 100 - (100 / (1 + RS))
-        where RS = Average Gain / Average Loss over period
+        The first rsi_period deltas seed the averages with a simple mean,
+        after which each bar is an O(1) recursive update:
+        avg = (avg * (period - 1) + value) / period
+        
+        NaN closes are ignored so a missing bar cannot poison the averages.
         """
-        prices = np.array(self.price_history[-(self.rsi_period + 1):])
-        deltas = np.diff(prices)
+        if math.isnan(close_price):
+            return
         
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
+        if self._prev_close is None:
+            self._prev_close = close_price
+            return
+        
+        delta = close_price - self._prev_close
+        self._prev_close = close_price
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
         
-        avg_gain = np.mean(gains)
-        avg_loss = np.mean(losses)
+        p = self.rsi_period
+        if self._n_deltas < p:
+            self._avg_gain += gain / p
+            self._avg_loss += loss / p
+            self._n_deltas += 1
+        else:
+            self._avg_gain = (self._avg_gain * (p - 1) + gain) / p
+            self._avg_loss = (self._avg_loss * (p - 1) + loss) / p
+    
+    def _calculate_rsi(self) -> float:
+        """
+        Calculate Relative Strength Index.
         
-        if avg_loss == 0:
+        RSI = 100 - (100 / (1 + RS))
+        where RS = Wilder-smoothed Average Gain / Average Loss
+        """
+        if self._avg_loss == 0:
             return 100.0
         
-        rs = avg_gain / avg_loss
+        rs = self._avg_gain / self._avg_loss
         rsi = 100 - (100 / (1 + rs))
         
         return rsi
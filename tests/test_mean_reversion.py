@@ -0,0 +1,90 @@
+"""
+Tests for the RSI mean reversion strategy
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from strategies.mean_reversion import MeanReversionStrategy  # noqa: E402
+
+PERIOD = 14
+
+
+def _random_walk(n=200, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+
+
+def _strategy_rsi(prices):
+    """Feed prices bar by bar and collect RSI on valid bars once it is defined"""
+    strategy = MeanReversionStrategy(rsi_period=PERIOD)
+    values = []
+    for price in prices:
+        strategy.on_data({"close": price})
+        if strategy._n_deltas >= PERIOD and not np.isnan(price):
+            values.append(strategy._calculate_rsi())
+    return np.array(values)
+
+
+def _wilder_rsi(prices):
+    """Reference Wilder RSI: SMA seed, then ewm(alpha=1/period)"""
+    deltas = np.diff(prices)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+
+    def smooth(values):
+        seeded = np.concatenate(([values[:PERIOD].mean()], values[PERIOD:]))
+        return pd.Series(seeded).ewm(alpha=1 / PERIOD, adjust=False).mean().to_numpy()
+
+    return 100 - 100 / (1 + smooth(gains) / smooth(losses))
+
+
+def test_first_rsi_matches_windowed_formula():
+    prices = _random_walk()
+    deltas = np.diff(prices[:PERIOD + 1])
+    avg_gain = np.where(deltas > 0, deltas, 0).mean()
+    avg_loss = np.where(deltas < 0, -deltas, 0).mean()
+    expected = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    assert np.isclose(_strategy_rsi(prices)[0], expected)
+
+
+def test_rsi_follows_wilder_recursion():
+    prices = _random_walk()
+    np.testing.assert_allclose(_strategy_rsi(prices), _wilder_rsi(prices))
+
+
+def test_rsi_recovers_after_nan_close():
+    prices = _random_walk()
+    with_gap = prices.copy()
+    with_gap[50] = np.nan
+
+    rsi = _strategy_rsi(with_gap)
+
+    assert not np.isnan(rsi).any()
+    np.testing.assert_allclose(rsi, _wilder_rsi(np.delete(prices, 50)))
+
+
+def test_strategy_trades_through_nan_close():
+    """Without a price history, a NaN bar must not stop the strategy trading"""
+    prices = _random_walk(n=600)
+    with_gap = prices.copy()
+    with_gap[50] = np.nan
+
+    def run(series):
+        strategy = MeanReversionStrategy(rsi_period=PERIOD)
+        strategy.current_capital = 100_000
+        for price in series:
+            strategy.on_data({"close": price})
+        return strategy
+
+    strategy = run(with_gap)
+
+    assert not hasattr(strategy, "price_history")
+    assert strategy.trades
+    assert strategy.trades == run(np.delete(prices, 50)).trades
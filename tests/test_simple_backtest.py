@@ -0,0 +1,130 @@
+"""
+Tests for the SMA crossover backtest example
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "examples"))
+
+import simple_backtest  # noqa: E402
+from simple_backtest import (  # noqa: E402
+    SimpleBacktester,
+    calculate_crossovers,
+    calculate_sma,
+    generate_sample_data,
+    run_portfolio,
+    run_sma_crossover_backtest,
+    run_sma_crossover_grid,
+)
+
+
+def test_backtest_with_nan_close():
+    """A missing close must not crash the backtest or trade at a NaN price"""
+    data = generate_sample_data(400)
+    closes = data["close"].to_numpy()
+
+    # Blank a bar in a bearish stretch, so the NaN bar itself is a buy signal
+    spread = calculate_sma(closes, 20) - calculate_sma(closes, 50)
+    bar = np.flatnonzero(spread < 0)[10]
+    data.iloc[bar, data.columns.get_loc("close")] = np.nan
+
+    results = run_sma_crossover_backtest(data, fast_period=20, slow_period=50)
+
+    assert np.isfinite(results["final_value"])
+    assert results["total_trades"] > 0
+    assert not results["trades"]["price"].isna().any()
+
+
+def test_run_accepts_any_crossover_dtype():
+    """SimpleBacktester.run takes generic signal arrays, not only int8"""
+    closes = generate_sample_data(400)["close"].to_numpy()
+    crossover = calculate_crossovers(closes, 20, 50)
+
+    expected = SimpleBacktester().run(closes, crossover).copy()
+
+    for dtype in (np.int64, np.float64):
+        backtester = SimpleBacktester()
+        equity = backtester.run(closes, (crossover * 3).astype(dtype))
+        np.testing.assert_array_equal(equity, expected)
+
+    float_signals = crossover.astype(np.float64)
+    float_signals[0] = np.nan
+    np.testing.assert_array_equal(SimpleBacktester().run(closes, float_signals), expected)
+
+
+def test_calculate_sma_fallback_recovers_after_nan(monkeypatch):
+    """Without bottleneck, a NaN only blanks the windows that contain it"""
+    monkeypatch.setattr(simple_backtest, "bn", None)
+    prices = generate_sample_data(400)["close"].to_numpy().copy()
+    prices[100] = np.nan
+
+    expected = pd.Series(prices).rolling(20).mean().to_numpy()
+    np.testing.assert_allclose(calculate_sma(prices, 20), expected, equal_nan=True)
+
+
+def _assert_matches_reference(close, fast, slow, row, equity):
+    """Compare one fused-kernel result against run_sma_crossover_backtest"""
+    reference = run_sma_crossover_backtest(close.to_frame("close"), fast, slow)
+
+    assert row["total_trades"] == reference["total_trades"]
+    assert np.isclose(row["final_value"], reference["final_value"], rtol=1e-4)
+    assert np.isclose(row["max_drawdown"], reference["max_drawdown"], atol=1e-4)
+    np.testing.assert_allclose(
+        equity.to_numpy(), reference["equity_curve"]["value"].to_numpy(), rtol=1e-4
+    )
+
+
+@pytest.mark.parametrize("nan_bar", [None, 150])
+def test_grid_matches_single_backtests(nan_bar):
+    """The fused grid kernel agrees with the reference backtest per combination"""
+    data = generate_sample_data(600)
+    if nan_bar is not None:
+        data.iloc[nan_bar, data.columns.get_loc("close")] = np.nan
+
+    grid = run_sma_crossover_grid(data, fast_periods=[5, 20], slow_periods=[30, 50])
+
+    for (fast, slow), row in grid["results"].iterrows():
+        _assert_matches_reference(
+            data["close"], fast, slow, row, grid["equity_curves"][(fast, slow)]
+        )
+
+
+def test_portfolio_matches_single_backtests():
+    """run_portfolio agrees with the reference backtest for every symbol"""
+    close = generate_sample_data(600)["close"]
+    drift = np.linspace(0.8, 1.2, len(close))
+    close_matrix = pd.DataFrame(
+        {"A": close, "B": close * drift, "C": close[::-1].to_numpy()},
+        index=close.index,
+    )
+
+    portfolio = run_portfolio(close_matrix, fast_period=10, slow_period=40)
+
+    for symbol, row in portfolio["results"].iterrows():
+        _assert_matches_reference(
+            close_matrix[symbol], 10, 40, row, portfolio["equity_curves"][symbol]
+        )
+
+
+def test_portfolio_handles_nan_gaps():
+    """Symbols listing late or delisting early still backtest cleanly"""
+    close = generate_sample_data(600)["close"]
+    listed_late = close.copy()
+    listed_late.iloc[:100] = np.nan
+    delisted = close[::-1].copy()
+    delisted.iloc[450:] = np.nan
+    close_matrix = pd.DataFrame({"A": close, "B": listed_late, "C": delisted})
+
+    portfolio = run_portfolio(close_matrix, fast_period=10, slow_period=40)
+
+    assert np.isfinite(portfolio["results"].to_numpy()).all()
+    assert not portfolio["equity_curves"].isna().any().any()
+    for symbol, row in portfolio["results"].iterrows():
+        _assert_matches_reference(
+            close_matrix[symbol], 10, 40, row, portfolio["equity_curves"][symbol]
+        )